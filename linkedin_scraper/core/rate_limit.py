@@ -7,12 +7,18 @@ Also enforces a per-account daily cap on profiles scraped.
 """
 
 import asyncio
-import json
+import atexit
 import logging
+import mmap
+import os
+import stat
 import time
-from datetime import date
+from dataclasses import dataclass
+from datetime import date, datetime
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Default: at least 45 seconds between person-profile requests per account
@@ -24,26 +30,176 @@ STATE_DIR = Path(__file__).resolve().parent.parent
 RATE_LIMIT_STATE_FILE = STATE_DIR / ".rate_limit_state.json"
 
 
+# In-memory copy of the state file; writes are coalesced and flushed at most every
+# STATE_FLUSH_INTERVAL_SEC (rate-limit errors and process exit flush immediately).
+STATE_FLUSH_INTERVAL_SEC = 2.0
+_STATE_CACHE: dict | None = None
+_STATE_MTIME: float = 0.0
+_STATE_DIRTY: bool = False
+_LAST_FLUSH_MONO: float = 0.0
+# False once the state file is known to be missing; only _save_state sets it back to True,
+# so runs that never record anything skip the stat() on every check
+_STATE_EXISTS: bool | None = None
+# Monotonic time before which no other profile may start in this process; claimed
+# synchronously so concurrent tasks are staggered instead of all waking together
+_NEXT_START_MONO: float = 0.0
+# Monotonic time of the last profile started in this process, and the wall-clock
+# last_profile_at persisted with it (to tell whether another process started one since)
+_LAST_PROFILE_MONO: float = 0.0
+_LAST_PROFILE_AT: float = 0.0
+# (ISO date, end-of-day epoch) for _end_of_today_epoch
+_EOD_CACHE: tuple[str, float] = ("", 0.0)
+
+
+def _read_state_file() -> dict:
+    """Read and parse the state file (raises on I/O or parse errors)."""
+    with open(RATE_LIMIT_STATE_FILE, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            return {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+# Daily fields reset when date_today changes; merged only between same-day states
+_DAILY_KEYS = ("date_today", "profiles_today", "rate_limit_count_today", "degradation_mode")
+_DEGRADATION_RANK = {"normal": 0, "reduced": 1, "stopped": 2}
+
+
+def _merge_states(ours: dict, theirs: dict) -> dict:
+    """
+    Merge this process's pending state with state another process wrote to disk.
+    Timestamps and counters take the larger value and degradation the stronger mode,
+    so neither side's backoff is lost.
+    """
+    merged = {**theirs, **ours}
+    for key in ("backoff_until", "last_profile_at", "last_rate_limit_at", "rate_limit_count"):
+        values = [s[key] for s in (ours, theirs) if s.get(key) is not None]
+        if values:
+            merged[key] = max(values)
+    our_day = ours.get("date_today") or ""
+    their_day = theirs.get("date_today") or ""
+    if their_day > our_day:
+        for key in _DAILY_KEYS:
+            if key in theirs:
+                merged[key] = theirs[key]
+            else:
+                merged.pop(key, None)
+    elif their_day == our_day:
+        for key in ("profiles_today", "rate_limit_count_today"):
+            merged[key] = max(ours.get(key, 0), theirs.get(key, 0))
+        merged["degradation_mode"] = max(
+            ours.get("degradation_mode", "normal"),
+            theirs.get("degradation_mode", "normal"),
+            key=lambda mode: _DEGRADATION_RANK.get(mode, 0),
+        )
+    return merged
+
+
+def _merge_external_changes() -> None:
+    """If the state file changed since we last read or wrote it, merge it into the pending cache."""
+    global _STATE_CACHE, _STATE_MTIME
+    try:
+        mtime = RATE_LIMIT_STATE_FILE.stat().st_mtime
+    except OSError:
+        return
+    if mtime == _STATE_MTIME:
+        return
+    try:
+        theirs = _read_state_file()
+    except Exception as e:
+        logger.warning("Could not load rate-limit state: %s", e)
+        return
+    _STATE_CACHE = _merge_states(_STATE_CACHE or {}, theirs)
+    _STATE_MTIME = mtime
+
+
 def _load_state() -> dict:
     """Load persisted rate-limit state (global; keyed by account in the future)."""
-    if not RATE_LIMIT_STATE_FILE.exists():
+    global _STATE_CACHE, _STATE_MTIME, _STATE_EXISTS
+    if _STATE_DIRTY and _STATE_CACHE is not None:
+        # Unflushed writes are pending: fold in anything another process wrote meanwhile
+        _merge_external_changes()
+        if time.monotonic() - _LAST_FLUSH_MONO >= STATE_FLUSH_INTERVAL_SEC:
+            _flush_now()
+        return dict(_STATE_CACHE)
+    if _STATE_EXISTS is False:
+        return {}
+    try:
+        mtime = RATE_LIMIT_STATE_FILE.stat().st_mtime
+    except FileNotFoundError:
+        _STATE_CACHE = None
+        _STATE_EXISTS = False
+        return {}
+    except OSError as e:
+        logger.warning("Could not load rate-limit state: %s", e)
         return {}
+    if _STATE_CACHE is not None and mtime == _STATE_MTIME:
+        return dict(_STATE_CACHE)
     try:
-        with open(RATE_LIMIT_STATE_FILE, "r") as f:
-            return json.load(f)
+        data = _read_state_file()
     except Exception as e:
         logger.warning("Could not load rate-limit state: %s", e)
         return {}
+    _STATE_CACHE = data
+    _STATE_MTIME = mtime
+    return dict(data)
 
 
-def _save_state(state: dict) -> None:
-    """Persist rate-limit state."""
+def _flush_now() -> None:
+    """Write pending state to disk atomically (temp file + os.replace)."""
+    global _STATE_DIRTY, _STATE_MTIME, _LAST_FLUSH_MONO
+    if not _STATE_DIRTY or _STATE_CACHE is None:
+        return
+    tmp_name = None
     try:
+        # Never overwrite state another process wrote after our last read (e.g. its backoff)
+        _merge_external_changes()
         RATE_LIMIT_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(RATE_LIMIT_STATE_FILE, "w") as f:
-            json.dump(state, f, indent=2)
+        candidate = str(RATE_LIMIT_STATE_FILE.with_name(
+            f"{RATE_LIMIT_STATE_FILE.name}.{os.getpid()}.{os.urandom(4).hex()}.tmp"
+        ))
+        # Created 0o666 so the kernel applies the umask, as a plain open() would
+        fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        tmp_name = candidate
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(_STATE_CACHE, option=orjson.OPT_INDENT_2))
+        try:
+            # Keep the permissions of an existing state file
+            os.chmod(tmp_name, stat.S_IMODE(RATE_LIMIT_STATE_FILE.stat().st_mode))
+        except FileNotFoundError:
+            pass
+        # Take the mtime from our own file so a write racing the replace is not mistaken for ours
+        mtime = os.stat(tmp_name).st_mtime
+        os.replace(tmp_name, RATE_LIMIT_STATE_FILE)
+        tmp_name = None
+        _STATE_MTIME = mtime
+        _STATE_DIRTY = False
+        _LAST_FLUSH_MONO = time.monotonic()
     except Exception as e:
         logger.warning("Could not save rate-limit state: %s", e)
+    finally:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def _save_state(state: dict, flush: bool = False) -> None:
+    """
+    Persist rate-limit state. The in-memory cache is updated immediately; the file
+    write is deferred unless flush=True or STATE_FLUSH_INTERVAL_SEC has passed.
+    """
+    global _STATE_CACHE, _STATE_DIRTY, _STATE_EXISTS
+    _STATE_CACHE = dict(state)
+    _STATE_DIRTY = True
+    _STATE_EXISTS = True
+    if flush or time.monotonic() - _LAST_FLUSH_MONO >= STATE_FLUSH_INTERVAL_SEC:
+        _flush_now()
+
+
+atexit.register(_flush_now)
 
 
 def _account_key(session_path: str | Path | None) -> str:
@@ -53,6 +209,37 @@ def _account_key(session_path: str | Path | None) -> str:
     return "default"
 
 
+def _pending_waits(state: dict, min_delay_sec: float) -> tuple[float, float]:
+    """Return (backoff_sec, throttle_sec) still to wait according to state, as of now."""
+    now = time.time()
+    backoff_until = state.get("backoff_until") or 0
+    backoff_sec = backoff_until - now if backoff_until and now < backoff_until else 0.0
+    throttle_sec = 0.0
+    last_at = state.get("last_profile_at") or 0
+    if last_at:
+        if _LAST_PROFILE_MONO and last_at == _LAST_PROFILE_AT:
+            # Immune to wall-clock jumps (NTP, DST, VM suspend)
+            elapsed = time.monotonic() - _LAST_PROFILE_MONO
+        else:
+            # Recorded by another process or before a restart: only wall-clock is available
+            elapsed = max(0.0, now - last_at)
+        if elapsed < min_delay_sec:
+            throttle_sec = min_delay_sec - elapsed
+    return backoff_sec, throttle_sec
+
+
+def _reserve_profile_slot(throttle_sec: float, min_delay_sec: float) -> float:
+    """
+    Claim the next profile start slot in this process and return its monotonic time.
+    Runs without awaiting, so no other task can claim the same slot in between.
+    """
+    global _NEXT_START_MONO
+    now = time.monotonic()
+    slot_at = now + max(throttle_sec, _NEXT_START_MONO - now, 0.0)
+    _NEXT_START_MONO = slot_at + min_delay_sec
+    return slot_at
+
+
 async def wait_if_needed_before_profile(
     session_path: str | Path | None = None,
     min_delay_sec: float = MIN_DELAY_BETWEEN_PROFILES_SEC,
@@ -61,42 +248,46 @@ async def wait_if_needed_before_profile(
     Call before starting a person-profile scrape. If the last profile request was
     too recent, sleeps until min_delay_sec has elapsed. If we are in backoff
     (after a RateLimitError), sleeps until backoff_until or raises.
+
+    Concurrent callers in one process are queued min_delay_sec apart. The slot is
+    claimed here, so a caller that then skips the profile (daily cap, degradation
+    mode) still delays the next caller by up to min_delay_sec.
     """
     key = _account_key(session_path)
-    state = _load_state()
-    now = time.time()
-
-    backoff_until = state.get("backoff_until") or 0
-    if backoff_until and now < backoff_until:
-        wait_sec = backoff_until - now
-        logger.warning(
-            "Rate-limit backoff active: waiting %.0f s before next profile (account=%s)",
-            wait_sec,
-            key[:32],
-        )
+    slot_at = None
+    # Re-check state after every sleep: a rate limit may have been recorded meanwhile
+    while True:
+        backoff_sec, throttle_sec = _pending_waits(_load_state(), min_delay_sec)
+        if backoff_sec > 0:
+            logger.warning(
+                "Rate-limit backoff active: waiting %.0f s before next profile (account=%s)",
+                backoff_sec,
+                key[:32],
+            )
+            await asyncio.sleep(backoff_sec)
+            # Queue again after the backoff so waiters do not all start together
+            slot_at = None
+            continue
+
+        if slot_at is None:
+            slot_at = _reserve_profile_slot(throttle_sec, min_delay_sec)
+        wait_sec = max(throttle_sec, slot_at - time.monotonic())
+        if wait_sec <= 0:
+            break
+        logger.debug("Throttle: waiting %.1f s before next profile", wait_sec)
         await asyncio.sleep(wait_sec)
-        # Re-load in case of concurrent update
-        state = _load_state()
-        backoff_until = state.get("backoff_until") or 0
-        if backoff_until and time.time() < backoff_until:
-            await asyncio.sleep(backoff_until - time.time())
-
-    last_at = state.get("last_profile_at") or 0
-    if last_at:
-        elapsed = now - last_at
-        if elapsed < min_delay_sec:
-            sleep_sec = min_delay_sec - elapsed
-            logger.debug("Throttle: waiting %.1f s before next profile", sleep_sec)
-            await asyncio.sleep(sleep_sec)
 
     # Caller must call record_profile_started() when the profile scrape actually starts
 
 
 def record_profile_started(session_path: str | Path | None = None) -> None:
     """Record that a profile scrape has started (for throttle and daily cap accounting)."""
+    global _LAST_PROFILE_MONO, _LAST_PROFILE_AT
     state = _load_state()
     now = time.time()
     state["last_profile_at"] = now
+    _LAST_PROFILE_MONO = time.monotonic()
+    _LAST_PROFILE_AT = now
     today_str = date.today().isoformat()
     if state.get("date_today") != today_str:
         state["date_today"] = today_str
@@ -108,11 +299,15 @@ def record_profile_started(session_path: str | Path | None = None) -> None:
 
 
 def _end_of_today_epoch() -> float:
-    """Return Unix timestamp for end of current day (23:59:59 local)."""
-    from datetime import datetime
+    """Return Unix timestamp for end of current day (23:59:59 local), cached per day."""
+    global _EOD_CACHE
     today = date.today()
-    end = datetime(today.year, today.month, today.day, 23, 59, 59)
-    return end.timestamp()
+    today_str = today.isoformat()
+    if _EOD_CACHE[0] == today_str:
+        return _EOD_CACHE[1]
+    end = datetime(today.year, today.month, today.day, 23, 59, 59).timestamp()
+    _EOD_CACHE = (today_str, end)
+    return end
 
 
 def record_rate_limit_error(
@@ -156,40 +351,70 @@ def record_rate_limit_error(
             endpoint or "profile",
             key[:48] if len(key) > 48 else key,
         )
-    _save_state(state)
+    _save_state(state, flush=True)
 
 
-def get_backoff_remaining_sec(session_path: str | Path | None = None) -> float:
-    """Return seconds remaining in backoff, or 0 if not in backoff."""
+@dataclass(frozen=True)
+class RateLimitSnapshot:
+    """Point-in-time view of rate-limit state, computed from a single state read."""
+
+    in_backoff: bool
+    backoff_remaining: float
+    profiles_today: int
+    cap_remaining: int
+    degradation_mode: str
+    rate_limit_count_today: int
+
+
+def get_rate_limit_snapshot(session_path: str | Path | None = None) -> RateLimitSnapshot:
+    """
+    Return backoff, daily-cap and degradation state in one call. Prefer this over
+    calling the individual getters back-to-back before each profile.
+    """
     state = _load_state()
     backoff_until = state.get("backoff_until") or 0
-    if backoff_until <= 0:
-        return 0.0
-    return max(0.0, backoff_until - time.time())
+    backoff_remaining = max(0.0, backoff_until - time.time()) if backoff_until > 0 else 0.0
+    if state.get("date_today") == date.today().isoformat():
+        profiles_today = state.get("profiles_today", 0)
+        rate_limit_count_today = state.get("rate_limit_count_today", 0)
+        degradation_mode = state.get("degradation_mode", "normal")
+    else:
+        profiles_today = 0
+        rate_limit_count_today = 0
+        degradation_mode = "normal"
+    return RateLimitSnapshot(
+        in_backoff=backoff_remaining > 0,
+        backoff_remaining=backoff_remaining,
+        profiles_today=profiles_today,
+        cap_remaining=max(0, MAX_PROFILES_PER_DAY - profiles_today),
+        degradation_mode=degradation_mode,
+        rate_limit_count_today=rate_limit_count_today,
+    )
+
+
+def get_backoff_remaining_sec(session_path: str | Path | None = None) -> float:
+    """Return seconds remaining in backoff, or 0 if not in backoff."""
+    return get_rate_limit_snapshot(session_path).backoff_remaining
 
 
 def is_in_backoff(session_path: str | Path | None = None) -> bool:
     """Return True if we are currently in backoff (do not start new profile scrapes)."""
-    return get_backoff_remaining_sec(session_path) > 0
+    return get_rate_limit_snapshot(session_path).in_backoff
 
 
 def get_profiles_scraped_today(session_path: str | Path | None = None) -> int:
     """Return number of profiles recorded today (same account key as other state)."""
-    state = _load_state()
-    today_str = date.today().isoformat()
-    if state.get("date_today") != today_str:
-        return 0
-    return state.get("profiles_today", 0)
+    return get_rate_limit_snapshot(session_path).profiles_today
 
 
 def would_exceed_daily_cap(session_path: str | Path | None = None) -> bool:
     """Return True if scraping one more profile would exceed the daily cap."""
-    return get_profiles_scraped_today(session_path) >= MAX_PROFILES_PER_DAY
+    return get_rate_limit_snapshot(session_path).cap_remaining <= 0
 
 
 def get_daily_cap_remaining(session_path: str | Path | None = None) -> int:
     """Return how many profiles can still be scraped today before hitting the cap."""
-    return max(0, MAX_PROFILES_PER_DAY - get_profiles_scraped_today(session_path))
+    return get_rate_limit_snapshot(session_path).cap_remaining
 
 
 def get_degradation_mode(session_path: str | Path | None = None) -> str:
@@ -198,25 +423,14 @@ def get_degradation_mode(session_path: str | Path | None = None) -> str:
     "reduced" = first rate limit today -> scrape only name/headline/current experience.
     "stopped" = repeated rate limit -> do not scrape more profiles today.
     """
-    state = _load_state()
-    today_str = date.today().isoformat()
-    if state.get("date_today") != today_str:
-        return "normal"
-    return state.get("degradation_mode", "normal")
+    return get_rate_limit_snapshot(session_path).degradation_mode
 
 
 def get_rate_limit_metrics(session_path: str | Path | None = None) -> dict:
     """Return simple metrics for logging: profiles_today, rate_limit_count_today, degradation_mode."""
-    state = _load_state()
-    today_str = date.today().isoformat()
-    if state.get("date_today") != today_str:
-        return {
-            "profiles_today": 0,
-            "rate_limit_count_today": 0,
-            "degradation_mode": "normal",
-        }
+    snapshot = get_rate_limit_snapshot(session_path)
     return {
-        "profiles_today": state.get("profiles_today", 0),
-        "rate_limit_count_today": state.get("rate_limit_count_today", 0),
-        "degradation_mode": state.get("degradation_mode", "normal"),
+        "profiles_today": snapshot.profiles_today,
+        "rate_limit_count_today": snapshot.rate_limit_count_today,
+        "degradation_mode": snapshot.degradation_mode,
     }
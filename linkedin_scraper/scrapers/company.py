@@ -14,6 +14,46 @@ from .base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Overview <dt> label (lowercased) -> overview field
+_LABEL_MAP = {
+    "industry": "industry",
+    "company size": "company_size",
+    "headquarters": "headquarters",
+    "location": "headquarters",
+    "specialties": "specialties",
+    "founded": "founded",
+    "company type": "company_type",
+    "phone": "phone",
+    "website": "website",
+}
+# Substring fallbacks for labels not in _LABEL_MAP, checked in order
+_LABEL_FALLBACKS = (
+    ("website", "website"),
+    ("industry", "industry"),
+    ("size", "company_size"),
+    ("headquarters", "headquarters"),
+    ("location", "headquarters"),
+    ("specialt", "specialties"),
+    ("founded", "founded"),
+    ("type", "company_type"),
+    ("phone", "phone"),
+)
+
+
+def _overview_field_for_label(label: str) -> Optional[str]:
+    """Return the overview field for a <dt> label, or None if it is not one we extract."""
+    field = _LABEL_MAP.get(label)
+    if field is not None:
+        return field
+    if "verified page" in label:
+        return None
+    for needle, field in _LABEL_FALLBACKS:
+        if needle in label:
+            if field == "company_type" and "verified" in label:
+                continue
+            return field
+    return None
+
 
 class CompanyScraper(BaseScraper):
     """
@@ -25,6 +65,76 @@ class CompanyScraper(BaseScraper):
             company = await scraper.scrape("https://www.linkedin.com/company/microsoft/")
             print(company.to_json())
     """
+
+    # Selectors for the overview section (main page and /about/ page)
+    _MAIN_PAGE_HEADINGS = ("Overview", "About", "About us")
+    _ABOUT_P = "p.break-words.text-body-medium"
+    _DL = "dl.overflow-hidden"
+    _DT_LABEL = "h3.text-heading-medium"
+    _DT_LABEL_FALLBACK = ".text-heading-medium"
+
+    # _OVERVIEW_JS arguments: the main page falls back to h3 headings and plain p/dl,
+    # the /about/ page only accepts its own "Overview" section markup
+    _MAIN_PAGE_OVERVIEW_ARGS = {
+        "headings": list(_MAIN_PAGE_HEADINGS),
+        "headingTags": ["h2", "h3"],
+        "aboutSelectors": [_ABOUT_P, "p"],
+        "dlSelectors": [_DL, "dl"],
+        "labelSelectors": [_DT_LABEL, _DT_LABEL_FALLBACK],
+    }
+    _ABOUT_PAGE_OVERVIEW_ARGS = {
+        "headings": ["Overview"],
+        "headingTags": ["h2"],
+        "aboutSelectors": [_ABOUT_P],
+        "dlSelectors": [_DL],
+        "labelSelectors": [_DT_LABEL, _DT_LABEL_FALLBACK],
+    }
+
+    # Finds the first section whose heading contains one of `headings` (tried in order,
+    # each tag in `headingTags` in turn) and returns its about paragraph and the raw
+    # dt/dd entries of its definition list, all in a single round-trip.
+    _OVERVIEW_JS = '''({headings, headingTags, aboutSelectors, dlSelectors, labelSelectors}) => {
+        const first = (root, selectors) => {
+            for (const sel of selectors) {
+                const el = root.querySelector(sel);
+                if (el) return el;
+            }
+            return null;
+        };
+        const sections = Array.from(document.querySelectorAll('section'));
+        let section = null;
+        for (const heading of headings) {
+            const needle = heading.toLowerCase();
+            for (const tag of headingTags) {
+                section = sections.find(s => Array.from(s.querySelectorAll(tag)).some(
+                    h => h.textContent.toLowerCase().includes(needle)
+                ));
+                if (section) break;
+            }
+            if (section) break;
+        }
+        if (!section) return null;
+
+        const aboutP = first(section, aboutSelectors);
+        const dl = first(section, dlSelectors);
+        const entries = [];
+        if (dl) {
+            for (const dt of dl.querySelectorAll('dt')) {
+                const labelEl = first(dt, labelSelectors);
+                if (!labelEl) continue;
+                let dd = dt.nextElementSibling;
+                while (dd && dd.tagName !== 'DD') dd = dd.nextElementSibling;
+                if (!dd) continue;
+                const link = dd.querySelector('a[href]');
+                entries.push({
+                    label: labelEl.innerText.trim().toLowerCase(),
+                    text: dd.innerText.trim(),
+                    href: link ? link.getAttribute('href') : null,
+                });
+            }
+        }
+        return {about: aboutP ? aboutP.innerText.trim() : null, entries};
+    }'''
     
     def __init__(self, page: Page, callback: Optional[ProgressCallback] = None):
         """
@@ -60,73 +170,38 @@ class CompanyScraper(BaseScraper):
             "specialties": None,
         }
         try:
-            # Try section with "Overview" or "About" (main page often has sidebar or block)
-            for heading in ("Overview", "About", "About us"):
-                section_loc = self.page.locator(f'section:has(h2:has-text("{heading}"))')
-                if await section_loc.count() == 0:
-                    section_loc = self.page.locator(f'section:has(h3:has-text("{heading}"))')
-                if await section_loc.count() == 0:
-                    continue
-                section = section_loc.first
-
-                # About-us: first substantial paragraph
-                about_p = section.locator("p.break-words.text-body-medium").first
-                if await about_p.count() == 0:
-                    about_p = section.locator("p").first
-                if await about_p.count() > 0:
-                    text = (await about_p.inner_text()).strip()
-                    if len(text) > 20:
-                        overview["about_us"] = text
-
-                # Definition list (same structure as /about/ page)
-                dl_loc = section.locator("dl.overflow-hidden").first
-                if await dl_loc.count() == 0:
-                    dl_loc = section.locator("dl").first
-                if await dl_loc.count() > 0:
-                    dl = dl_loc
-                    dt_elements = await dl.locator("dt").all()
-                    for dt in dt_elements:
-                        label_elem = dt.locator("h3.text-heading-medium").first
-                        if await label_elem.count() == 0:
-                            label_elem = dt.locator(".text-heading-medium").first
-                        if await label_elem.count() == 0:
-                            continue
-                        label = (await label_elem.inner_text()).strip().lower()
-                        if "verified page" in label:
-                            continue
-                        dd = dt.locator("xpath=following-sibling::dd[1]").first
-                        if await dd.count() == 0:
-                            continue
-                        if "website" in label:
-                            link = dd.locator("a[href]").first
-                            if await link.count() > 0:
-                                href = await link.get_attribute("href")
-                                if href and "linkedin.com" not in href:
-                                    overview["website"] = href.strip()
-                            if overview["website"] is None:
-                                overview["website"] = (await dd.inner_text()).strip()
-                            continue
-                        value = (await dd.inner_text()).strip()
-                        if not value:
-                            continue
-                        if "industry" in label:
-                            overview["industry"] = value
-                        elif "company size" in label or "size" in label:
-                            overview["company_size"] = value
-                        elif "headquarters" in label or "location" in label:
-                            overview["headquarters"] = value
-                        elif "specialt" in label:
-                            overview["specialties"] = value
-                        elif "founded" in label:
-                            overview["founded"] = value
-                        elif ("company type" in label or "type" in label) and "verified" not in label:
-                            overview["company_type"] = value
-                        elif "phone" in label:
-                            overview["phone"] = value
-                break
+            # Main page often has the overview in a sidebar or block headed "Overview"/"About"
+            data = await self.page.evaluate(self._OVERVIEW_JS, self._MAIN_PAGE_OVERVIEW_ARGS)
+            if not data:
+                return overview
+            about = data.get("about")
+            if about and len(about) > 20:
+                overview["about_us"] = about
+            self._apply_overview_entries(overview, data.get("entries") or [])
         except Exception as e:
             logger.debug(f"Error getting overview from main page: {e}")
         return overview
+
+    @staticmethod
+    def _apply_overview_entries(overview: dict, entries: list) -> None:
+        """Map (label, text, href) entries extracted from the overview <dl> onto overview fields."""
+        for entry in entries:
+            field = _overview_field_for_label(entry.get("label") or "")
+            if field is None:
+                continue
+
+            # Website: prefer href from link inside dd
+            if field == "website":
+                href = entry.get("href")
+                if href and "linkedin.com" not in href:
+                    overview["website"] = href.strip()
+                if overview["website"] is None:
+                    overview["website"] = entry.get("text") or ""
+                continue
+
+            value = entry.get("text")
+            if value:
+                overview[field] = value
     
     async def scrape(self, linkedin_url: str, skip_about_nav: bool = False) -> Company:
         """
@@ -157,10 +232,16 @@ class CompanyScraper(BaseScraper):
         await self.callback.on_progress(f"Got company name: {name}", 20)
 
         # Try overview from main page first; skip /about/ if good enough or if skip_about_nav
-        overview = await self._get_overview_from_main_page()
-        use_main_only = skip_about_nav or self._overview_field_count(overview) >= 2
+        main_overview = await self._get_overview_from_main_page()
+        overview = main_overview
+        use_main_only = skip_about_nav or self._overview_field_count(main_overview) >= 2
         if not use_main_only:
-            overview = await self._get_overview(linkedin_url)
+            # Keep whatever the main page already gave us; /about/ only fills the gaps
+            about_overview = await self._get_overview(linkedin_url)
+            overview = {
+                k: main_overview.get(k) or about_overview.get(k)
+                for k in main_overview
+            }
         await self.callback.on_progress("Got overview details", 50)
         
         # Create company object
@@ -191,19 +272,16 @@ class CompanyScraper(BaseScraper):
     async def _get_about(self) -> Optional[str]:
         """Extract about/description section."""
         try:
-            # Look for "About us" section
-            sections = await self.page.locator('section').all()
-            
-            for section in sections:
-                section_text = await section.inner_text()
-                if any(s in section_text[:100] for s in ('Overview', 'About', 'About us')):
-                    # Get the content paragraph
-                    paragraphs = await section.locator('p').all()
-                    if paragraphs:
-                        about = await paragraphs[0].inner_text()
-                        return about.strip()
-            
-            return None
+            # Look for "About us" section and return its first paragraph, in one round-trip
+            about = await self.page.evaluate('''() => {
+                for (const section of document.querySelectorAll('section')) {
+                    if (!/Overview|About/.test(section.innerText.slice(0, 100))) continue;
+                    const p = section.querySelector('p');
+                    if (p) return p.innerText.trim();
+                }
+                return null;
+            }''')
+            return about
         except Exception as e:
             logger.debug(f"Error getting about section: {e}")
             return None
@@ -231,67 +309,13 @@ class CompanyScraper(BaseScraper):
             about_url = linkedin_url.rstrip("/") + "/about/"
             await self.navigate_and_wait(about_url)
 
-            # Overview section: section containing h2 "Overview"
-            section_loc = self.page.locator('section:has(h2:has-text("Overview"))')
-            if await section_loc.count() == 0:
-                return overview
-            section = section_loc.first
-
-            # About-us: first paragraph with break-words / text-body-medium in that section
-            about_p = section.locator("p.break-words.text-body-medium").first
-            if await about_p.count() > 0:
-                overview["about_us"] = (await about_p.inner_text()).strip()
-
-            # Definition list in same section
-            dl_loc = section.locator("dl.overflow-hidden")
-            if await dl_loc.count() == 0:
+            # Overview section (h2 "Overview"): about paragraph and dt/dd list in one round-trip
+            data = await self.page.evaluate(self._OVERVIEW_JS, self._ABOUT_PAGE_OVERVIEW_ARGS)
+            if not data:
                 return overview
-            dl = dl_loc.first
-
-            dt_elements = await dl.locator("dt").all()
-            for dt in dt_elements:
-                label_elem = dt.locator("h3.text-heading-medium").first
-                if await label_elem.count() == 0:
-                    label_elem = dt.locator(".text-heading-medium").first
-                if await label_elem.count() == 0:
-                    continue
-                label = (await label_elem.inner_text()).strip().lower()
-                if "verified page" in label:
-                    continue
-
-                dd = dt.locator("xpath=following-sibling::dd[1]").first
-                if await dd.count() == 0:
-                    continue
-
-                # Website: prefer href from link inside dd
-                if "website" in label:
-                    link = dd.locator("a[href]").first
-                    if await link.count() > 0:
-                        href = await link.get_attribute("href")
-                        if href and "linkedin.com" not in href:
-                            overview["website"] = href.strip()
-                    if overview["website"] is None:
-                        overview["website"] = (await dd.inner_text()).strip()
-                    continue
-
-                value = (await dd.inner_text()).strip()
-                if not value:
-                    continue
-
-                if "industry" in label:
-                    overview["industry"] = value
-                elif "company size" in label or "size" in label:
-                    overview["company_size"] = value
-                elif "headquarters" in label or "location" in label:
-                    overview["headquarters"] = value
-                elif "specialt" in label:
-                    overview["specialties"] = value
-                elif "founded" in label:
-                    overview["founded"] = value
-                elif ("company type" in label or "type" in label) and "verified" not in label:
-                    overview["company_type"] = value
-                elif "phone" in label:
-                    overview["phone"] = value
+            if data.get("about") is not None:
+                overview["about_us"] = data["about"]
+            self._apply_overview_entries(overview, data.get("entries") or [])
 
         except Exception as e:
             logger.debug(f"Error getting company overview: {e}")
@@ -27,6 +27,7 @@ basic_requirements = [
     'pydantic>=2.0.0',
     'python-dotenv>=1.0.0',
     'aiofiles>=23.0.0',
+    'orjson>=3.8.0',
 ]
 
 setup(
@@ -1,6 +1,6 @@
 """Tests for CompanyScraper."""
 import pytest
-from linkedin_scraper import CompanyScraper
+from linkedin_scraper import BrowserManager, CompanyScraper
 from linkedin_scraper.models import Company
 
 
@@ -77,3 +77,277 @@ def test_company_model_to_json():
     json_str = company.to_json()
     assert isinstance(json_str, str)
     assert "Test Company" in json_str
+
+
+@pytest.mark.unit
+def test_company_scraper_exports_main_page_overview():
+    """The exported CompanyScraper must keep the main-page-first overview path."""
+    from linkedin_scraper.scrapers import CompanyScraper as ExportedScraper
+    from linkedin_scraper.scrapers.company import CompanyScraper as ModuleScraper
+    
+    assert ExportedScraper is ModuleScraper
+    assert hasattr(ExportedScraper, "_get_overview_from_main_page")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("label, field", [
+    # Exact labels
+    ("industry", "industry"),
+    ("company size", "company_size"),
+    ("headquarters", "headquarters"),
+    ("location", "headquarters"),
+    ("specialties", "specialties"),
+    ("founded", "founded"),
+    ("company type", "company_type"),
+    ("phone", "phone"),
+    ("website", "website"),
+    # Substring fallbacks
+    ("company website", "website"),
+    ("primary industry", "industry"),
+    ("size", "company_size"),
+    ("office location", "headquarters"),
+    ("specialty", "specialties"),
+    ("year founded", "founded"),
+    ("type", "company_type"),
+    ("phone number", "phone"),
+    # Skipped labels
+    ("verified page", None),
+    ("verified type", None),
+    ("employees on linkedin", None),
+    ("", None),
+])
+def test_overview_field_for_label(label, field):
+    """Overview <dt> labels map to the same fields as the original if/elif chain."""
+    from linkedin_scraper.scrapers.company import _overview_field_for_label
+    
+    assert _overview_field_for_label(label) == field
+
+
+@pytest.mark.unit
+def test_apply_overview_entries():
+    """Entries are applied with website href preference and empty values skipped."""
+    overview = {
+        "about_us": None,
+        "website": None,
+        "phone": None,
+        "headquarters": None,
+        "founded": None,
+        "industry": None,
+        "company_type": None,
+        "company_size": None,
+        "specialties": None,
+    }
+    entries = [
+        {"label": "website", "text": "example.com", "href": "https://example.com "},
+        {"label": "industry", "text": "Software", "href": None},
+        {"label": "founded", "text": "", "href": None},
+        {"label": "verified page", "text": "March 2021", "href": None},
+        {"label": "company type", "text": "Public Company", "href": None},
+    ]
+    
+    CompanyScraper._apply_overview_entries(overview, entries)
+    
+    assert overview["website"] == "https://example.com"
+    assert overview["industry"] == "Software"
+    assert overview["founded"] is None
+    assert overview["company_type"] == "Public Company"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("href, text, expected", [
+    # linkedin.com redirect links fall back to the visible text
+    ("https://www.linkedin.com/redir?url=x", "example.com", "example.com"),
+    (None, "example.com", "example.com"),
+    (None, "", ""),
+])
+def test_apply_overview_entries_website_fallback(href, text, expected):
+    """Website falls back to dd text when the link is missing or points at linkedin.com."""
+    overview = {"website": None}
+    entries = [{"label": "website", "text": text, "href": href}]
+    
+    CompanyScraper._apply_overview_entries(overview, entries)
+    
+    assert overview["website"] == expected
+
+
+# Main-page style overview: h3 "About" heading, plain <p>/<dl>, span label fallback,
+# a non-<dd> sibling between <dt> and <dd>, and a linkedin.com website link
+MAIN_PAGE_HTML = """
+<section><h2>Activity</h2><p>Recent posts from the company page.</p></section>
+<section>
+  <h3>About</h3>
+  <p>We build developer tools for teams around the world.</p>
+  <dl>
+    <dt><span class="text-heading-medium">Website</span></dt>
+    <dd><a href="https://www.linkedin.com/redir/redirect?url=example.com">example.com</a></dd>
+    <dt><h3 class="text-heading-medium">Industry</h3></dt>
+    <dd>Software Development</dd>
+    <dt><h3 class="text-heading-medium">Company size</h3></dt>
+    <div class="spacer"></div>
+    <dd>51-200 employees</dd>
+    <dt><h3 class="text-heading-medium">Verified page</h3></dt>
+    <dd>March 2021</dd>
+    <dt><h3 class="text-heading-medium">Phone</h3></dt>
+  </dl>
+</section>
+"""
+
+# /about/ page overview: h2 "Overview" with the exact classes the /about/ path requires
+ABOUT_PAGE_HTML = """
+<section>
+  <h2>Overview</h2>
+  <p class="break-words text-body-medium">Short blurb</p>
+  <p>Ignored paragraph</p>
+  <dl class="overflow-hidden">
+    <dt><h3 class="text-heading-medium">Website</h3></dt>
+    <dd><a href="https://example.com">example.com</a></dd>
+    <dt><h3 class="text-heading-medium">Headquarters</h3></dt>
+    <dd>Berlin, Germany</dd>
+    <dt><h3 class="text-heading-medium">Founded</h3></dt>
+    <dd>2015</dd>
+    <dt><h3 class="text-heading-medium">Specialties</h3></dt>
+    <dd>APIs, developer tools</dd>
+  </dl>
+</section>
+"""
+
+NO_OVERVIEW_HTML = "<section><h2>Jobs</h2><p>No open roles right now.</p></section>"
+
+EMPTY_OVERVIEW = {
+    "about_us": None,
+    "website": None,
+    "phone": None,
+    "headquarters": None,
+    "founded": None,
+    "industry": None,
+    "company_type": None,
+    "company_size": None,
+    "specialties": None,
+}
+
+
+@pytest.fixture
+async def overview_scraper():
+    """CompanyScraper on a blank headless page, with /about/ navigation disabled."""
+    async with BrowserManager(headless=True) as browser:
+        scraper = CompanyScraper(browser.page)
+        
+        async def no_navigation(url, **kwargs):
+            return None
+        
+        scraper.navigate_and_wait = no_navigation
+        yield scraper
+
+
+async def _overview_via_locators(page, args):
+    """
+    Reference: the Playwright locator chain that _OVERVIEW_JS replaced, returning
+    the same raw {about, entries} shape.
+    """
+    async def first(root, selectors):
+        for selector in selectors:
+            loc = root.locator(selector).first
+            if await loc.count() > 0:
+                return loc
+        return None
+    
+    section = None
+    for heading in args["headings"]:
+        for tag in args["headingTags"]:
+            loc = page.locator(f'section:has({tag}:has-text("{heading}"))')
+            if await loc.count() > 0:
+                section = loc.first
+                break
+        if section is not None:
+            break
+    if section is None:
+        return None
+    
+    about_p = await first(section, args["aboutSelectors"])
+    dl = await first(section, args["dlSelectors"])
+    entries = []
+    if dl is not None:
+        for dt in await dl.locator("dt").all():
+            label_elem = await first(dt, args["labelSelectors"])
+            if label_elem is None:
+                continue
+            dd = dt.locator("xpath=following-sibling::dd[1]").first
+            if await dd.count() == 0:
+                continue
+            link = dd.locator("a[href]").first
+            entries.append({
+                "label": (await label_elem.inner_text()).strip().lower(),
+                "text": (await dd.inner_text()).strip(),
+                "href": await link.get_attribute("href") if await link.count() > 0 else None,
+            })
+    about = (await about_p.inner_text()).strip() if about_p is not None else None
+    return {"about": about, "entries": entries}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "html",
+    [MAIN_PAGE_HTML, ABOUT_PAGE_HTML, NO_OVERVIEW_HTML],
+    ids=["main-page", "about-page", "no-overview"],
+)
+@pytest.mark.parametrize("args_name", ["_MAIN_PAGE_OVERVIEW_ARGS", "_ABOUT_PAGE_OVERVIEW_ARGS"])
+async def test_overview_js_matches_locator_logic(overview_scraper, html, args_name):
+    """_OVERVIEW_JS extracts the same section, paragraph and dt/dd entries as the old locators."""
+    page = overview_scraper.page
+    args = getattr(CompanyScraper, args_name)
+    await page.set_content(html)
+    
+    from_js = await page.evaluate(CompanyScraper._OVERVIEW_JS, args)
+    
+    assert from_js == await _overview_via_locators(page, args)
+
+
+@pytest.mark.asyncio
+async def test_overview_from_main_page_fixture(overview_scraper):
+    """Main-page variant uses h3/<p>/<dl> fallbacks and skips linkedin.com website links."""
+    await overview_scraper.page.set_content(MAIN_PAGE_HTML)
+    
+    overview = await overview_scraper._get_overview_from_main_page()
+    
+    assert overview == {
+        **EMPTY_OVERVIEW,
+        "about_us": "We build developer tools for teams around the world.",
+        "website": "example.com",
+        "industry": "Software Development",
+        "company_size": "51-200 employees",
+    }
+
+
+@pytest.mark.asyncio
+async def test_overview_from_about_page_fixture(overview_scraper):
+    """/about/ variant reads the h2 "Overview" section, with no minimum about length."""
+    await overview_scraper.page.set_content(ABOUT_PAGE_HTML)
+    
+    overview = await overview_scraper._get_overview("https://www.linkedin.com/company/test/")
+    
+    assert overview == {
+        **EMPTY_OVERVIEW,
+        "about_us": "Short blurb",
+        "website": "https://example.com",
+        "headquarters": "Berlin, Germany",
+        "founded": "2015",
+        "specialties": "APIs, developer tools",
+    }
+
+
+@pytest.mark.asyncio
+async def test_overview_about_page_ignores_main_page_markup(overview_scraper):
+    """/about/ variant does not apply the main-page h3 and plain <p>/<dl> fallbacks."""
+    await overview_scraper.page.set_content(MAIN_PAGE_HTML)
+    
+    overview = await overview_scraper._get_overview("https://www.linkedin.com/company/test/")
+    
+    assert overview == EMPTY_OVERVIEW
+
+
+@pytest.mark.asyncio
+async def test_overview_from_main_page_without_section(overview_scraper):
+    """Pages without an Overview/About section yield an empty overview."""
+    await overview_scraper.page.set_content(NO_OVERVIEW_HTML)
+    
+    assert await overview_scraper._get_overview_from_main_page() == EMPTY_OVERVIEW
@@ -0,0 +1,237 @@
+"""Tests for the rate-limit state and throttle."""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from linkedin_scraper.core import rate_limit
+
+
+@pytest.fixture
+def state_file(tmp_path, monkeypatch):
+    """Point the rate limiter at a temp state file and reset its in-memory state."""
+    path = tmp_path / ".rate_limit_state.json"
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT_STATE_FILE", path)
+    monkeypatch.setattr(rate_limit, "_STATE_CACHE", None)
+    monkeypatch.setattr(rate_limit, "_STATE_MTIME", 0.0)
+    monkeypatch.setattr(rate_limit, "_STATE_DIRTY", False)
+    monkeypatch.setattr(rate_limit, "_LAST_FLUSH_MONO", 0.0)
+    monkeypatch.setattr(rate_limit, "_STATE_EXISTS", None)
+    monkeypatch.setattr(rate_limit, "_NEXT_START_MONO", 0.0)
+    monkeypatch.setattr(rate_limit, "_LAST_PROFILE_MONO", 0.0)
+    monkeypatch.setattr(rate_limit, "_LAST_PROFILE_AT", 0.0)
+    return path
+
+
+def _read_file(path):
+    return json.loads(path.read_text())
+
+
+@pytest.mark.unit
+def test_deferred_write_flushed_after_interval(state_file, monkeypatch):
+    """Writes within the flush interval stay in memory until the interval passes."""
+    rate_limit.record_profile_started()
+    assert _read_file(state_file)["profiles_today"] == 1
+
+    rate_limit.record_profile_started()
+    # Deferred: visible in memory, not yet on disk
+    assert rate_limit.get_profiles_scraped_today() == 2
+    assert _read_file(state_file)["profiles_today"] == 1
+
+    monkeypatch.setattr(
+        rate_limit, "_LAST_FLUSH_MONO",
+        time.monotonic() - rate_limit.STATE_FLUSH_INTERVAL_SEC,
+    )
+    rate_limit._load_state()
+    assert _read_file(state_file)["profiles_today"] == 2
+    assert rate_limit._STATE_DIRTY is False
+
+
+@pytest.mark.unit
+def test_rate_limit_error_flushes_immediately(state_file):
+    """record_rate_limit_error writes through even right after another flush."""
+    rate_limit.record_profile_started()
+    rate_limit.record_rate_limit_error(suggested_wait_time=60)
+
+    data = _read_file(state_file)
+    assert data["rate_limit_count_today"] == 1
+    assert data["degradation_mode"] == "reduced"
+    assert data["backoff_until"] > time.time()
+
+
+@pytest.mark.unit
+def test_external_change_detected_by_mtime(state_file):
+    """A file rewritten by another process is re-read once its mtime changes."""
+    state_file.write_text(json.dumps({"profiles_today": 1}))
+    assert rate_limit._load_state()["profiles_today"] == 1
+
+    state_file.write_text(json.dumps({"profiles_today": 5}))
+    mtime = state_file.stat().st_mtime + 10
+    os.utime(state_file, (mtime, mtime))
+    assert rate_limit._load_state()["profiles_today"] == 5
+
+
+@pytest.mark.unit
+def test_deferred_write_keeps_external_backoff(state_file):
+    """Pending writes are merged with, not written over, another process's backoff."""
+    rate_limit.record_profile_started()
+    rate_limit.record_profile_started()
+    assert rate_limit._STATE_DIRTY
+
+    # Another process hits a repeated rate limit and stops scraping for the day
+    external = _read_file(state_file)
+    external.update({
+        "degradation_mode": "stopped",
+        "rate_limit_count_today": 2,
+        "rate_limit_count": 2,
+        "backoff_until": time.time() + 10 * 3600,
+    })
+    state_file.write_text(json.dumps(external))
+    mtime = state_file.stat().st_mtime + 10
+    os.utime(state_file, (mtime, mtime))
+
+    assert rate_limit.is_in_backoff()
+    assert rate_limit.get_degradation_mode() == "stopped"
+
+    rate_limit._flush_now()
+    data = _read_file(state_file)
+    assert data["degradation_mode"] == "stopped"
+    assert data["backoff_until"] == external["backoff_until"]
+    assert data["rate_limit_count_today"] == 2
+    assert data["profiles_today"] == 2
+
+
+@pytest.mark.unit
+def test_merge_states_prefers_newer_day():
+    """State from a later day replaces the daily fields; same-day state keeps the maxima."""
+    ours = {"date_today": "2026-01-01", "profiles_today": 9, "degradation_mode": "stopped"}
+    theirs = {"date_today": "2026-01-02", "profiles_today": 1, "degradation_mode": "normal"}
+    merged = rate_limit._merge_states(ours, theirs)
+    assert merged["date_today"] == "2026-01-02"
+    assert merged["profiles_today"] == 1
+    assert merged["degradation_mode"] == "normal"
+
+    merged = rate_limit._merge_states(
+        {"date_today": "2026-01-02", "profiles_today": 3, "degradation_mode": "reduced"},
+        theirs,
+    )
+    assert merged["profiles_today"] == 3
+    assert merged["degradation_mode"] == "reduced"
+
+
+@pytest.mark.unit
+def test_empty_state_file(state_file):
+    """An empty state file loads as empty state."""
+    state_file.write_bytes(b"")
+    assert rate_limit._load_state() == {}
+
+
+@pytest.mark.unit
+def test_corrupt_state_file(state_file, caplog):
+    """A corrupt state file loads as empty state and logs a warning."""
+    state_file.write_text("{not json")
+    assert rate_limit._load_state() == {}
+    assert "Could not load rate-limit state" in caplog.text
+
+
+@pytest.mark.unit
+def test_flush_preserves_file_mode(state_file):
+    """Atomic writes keep the existing file's permission bits."""
+    rate_limit.record_profile_started()
+    os.chmod(state_file, 0o640)
+    rate_limit._save_state({"profiles_today": 2}, flush=True)
+    assert state_file.stat().st_mode & 0o777 == 0o640
+    assert list(state_file.parent.glob("*.tmp")) == []
+
+
+@pytest.mark.unit
+def test_new_state_file_respects_umask(state_file):
+    """A freshly created state file gets 0o666 minus the umask, like a plain open()."""
+    old_umask = os.umask(0o027)
+    try:
+        rate_limit.record_profile_started()
+    finally:
+        os.umask(old_umask)
+    assert state_file.stat().st_mode & 0o777 == 0o640
+
+
+@pytest.mark.unit
+def test_pending_write_flushed_at_exit(tmp_path):
+    """Deferred writes are flushed by the atexit hook when the process exits."""
+    path = tmp_path / ".rate_limit_state.json"
+    script = (
+        "from pathlib import Path\n"
+        "from linkedin_scraper.core import rate_limit\n"
+        f"rate_limit.RATE_LIMIT_STATE_FILE = Path({str(path)!r})\n"
+        "rate_limit.record_profile_started()\n"
+        "rate_limit.record_profile_started()\n"
+        "assert rate_limit._STATE_DIRTY\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parent.parent))
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)
+    assert _read_file(path)["profiles_today"] == 2
+
+
+@pytest.mark.unit
+def test_missing_file_flag_reset_by_save_and_external_delete(state_file):
+    """The cached "file missing" bit is cleared by a save and set again by a delete."""
+    assert rate_limit._load_state() == {}
+    assert rate_limit._STATE_EXISTS is False
+
+    rate_limit._save_state({"profiles_today": 3}, flush=True)
+    assert rate_limit._STATE_EXISTS is True
+    assert rate_limit._load_state()["profiles_today"] == 3
+
+    state_file.unlink()
+    assert rate_limit._load_state() == {}
+    assert rate_limit._STATE_EXISTS is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_waits_are_staggered(state_file):
+    """Concurrent callers each claim their own slot instead of all starting together."""
+    started = []
+
+    async def worker():
+        await rate_limit.wait_if_needed_before_profile(min_delay_sec=0.3)
+        started.append(time.monotonic())
+        rate_limit.record_profile_started()
+
+    t0 = time.monotonic()
+    await asyncio.gather(*(worker() for _ in range(3)))
+
+    offsets = sorted(t - t0 for t in started)
+    assert offsets[0] < 0.15
+    assert offsets[1] - offsets[0] >= 0.25
+    assert offsets[2] - offsets[1] >= 0.25
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_queued_waits_recheck_backoff(state_file):
+    """Callers queued behind the throttle do not start after a rate limit is recorded."""
+    async def first():
+        await rate_limit.wait_if_needed_before_profile(min_delay_sec=0.3)
+        rate_limit.record_profile_started()
+        await asyncio.sleep(0.05)
+        rate_limit.record_rate_limit_error(suggested_wait_time=60)
+
+    first_task = asyncio.create_task(first())
+    queued = [
+        asyncio.create_task(rate_limit.wait_if_needed_before_profile(min_delay_sec=0.3))
+        for _ in range(2)
+    ]
+    await first_task
+    done, pending = await asyncio.wait(queued, timeout=1.0)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    assert not done
+    assert rate_limit.is_in_backoff()